@@ -47,7 +47,7 @@ from qgis.PyQt.QtWidgets import (
     QProgressBar, QFrame, QScrollArea, QApplication,
     QComboBox, QTextEdit,
 )
-from qgis.PyQt.QtCore import Qt, QTimer
+from qgis.PyQt.QtCore import Qt, QTimer, QItemSelection, QItemSelectionModel
 from qgis.PyQt.QtGui import QFont, QColor, QKeySequence
 
 
@@ -576,9 +576,14 @@ class CopyPasteTable(QTableWidget):
             super().keyPressEvent(event)
 
     def _copy(self):
-        sel = sorted(self.selectedIndexes(), key=lambda i: (i.row(), i.column()))
+        sel = self.selectedIndexes()
         if not sel:
             return
+        # Single-cell copy is the common case - skip the sort/dict machinery
+        if len(sel) == 1:
+            QApplication.clipboard().setText(sel[0].data() or "")
+            return
+        sel = sorted(sel, key=lambda i: (i.row(), i.column()))
         rows = {}
         for idx in sel:
             rows.setdefault(idx.row(), {})[idx.column()] = idx.data() or ""
@@ -595,6 +600,8 @@ class CopyPasteTable(QTableWidget):
         if not text:
             return
         cur = self.currentIndex()
+        if not cur.isValid():
+            return
         start_row, start_col = cur.row(), cur.column()
 
         lines = text.split("\n")
@@ -603,6 +610,7 @@ class CopyPasteTable(QTableWidget):
         if not lines:
             return
 
+        max_cols = max(len(line.split("\t")) for line in lines)
         for r, line in enumerate(lines):
             for c, val in enumerate(line.split("\t")):
                 row, col = start_row + r, start_col + c
@@ -611,6 +619,17 @@ class CopyPasteTable(QTableWidget):
                     if item and (item.flags() & Qt.ItemIsEditable):
                         item.setText(val.strip())
 
+        # Select the pasted block with one QItemSelection spanning the
+        # rectangle - never cell-by-cell, which costs N selection updates.
+        tl = self.model().index(start_row, start_col)
+        br = self.model().index(
+            min(start_row + len(lines), self.rowCount()) - 1,
+            min(start_col + max_cols, self.columnCount()) - 1,
+        )
+        self.selectionModel().select(
+            QItemSelection(tl, br), QItemSelectionModel.ClearAndSelect
+        )
+
 
 # ============================================================================
 #  Main Dialog
@@ -1,138 +1,210 @@
-# -*- coding: utf-8 -*-
-"""
-RORB catg/stm Editor - Main Plugin Class
-
-Registers two toolbar actions:
-  1. CATG Editor — open/edit RORB Catchment (.catg) files in table format
-  2. STM Editor  — open/edit/create RORB Storm (.stm) files in table format
-"""
-
-import os
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt
-from qgis.PyQt.QtWidgets import QAction
-from qgis.PyQt.QtGui import QIcon
-
-
-class RORBFileEditorPlugin:
-    """Main plugin class for RORB File Editor."""
-
-    def __init__(self, iface):
-        """
-        Initialize the plugin.
-
-        Args:
-            iface: QGIS interface instance
-        """
-        self.iface = iface
-        self.plugin_dir = os.path.dirname(__file__)
-        self.actions = []
-        self.menu_name = "RORB catg/stm Editor"
-        self.toolbar = None
-        self.dialogs = []  # Track open dialogs for cleanup
-
-        # Initialize locale (with safe fallback)
-        locale_setting = QSettings().value('locale/userLocale')
-        locale = locale_setting[0:2] if locale_setting else 'en'
-        locale_path = os.path.join(
-            self.plugin_dir, 'i18n',
-            'RORBFileEditor_{}.qm'.format(locale))
-
-        if os.path.exists(locale_path):
-            self.translator = QTranslator()
-            self.translator.load(locale_path)
-            QCoreApplication.installTranslator(self.translator)
-
-    def tr(self, message):
-        """Translate string."""
-        return QCoreApplication.translate('RORBFileEditorPlugin', message)
-
-    def initGui(self):
-        """Initialize the GUI - called when plugin is loaded."""
-        # Create toolbar
-        self.toolbar = self.iface.addToolBar(self.menu_name)
-        self.toolbar.setObjectName("RORBCatgStmEditorToolbar")
-
-        # ---- CATG Editor action ----
-        icon_catg_path = os.path.join(self.plugin_dir, 'icon_catg.svg')
-        icon_catg = QIcon(icon_catg_path)
-
-        self.action_catg = QAction(
-            icon_catg,
-            self.tr("RORB CATG Editor"),
-            self.iface.mainWindow()
-        )
-        self.action_catg.setToolTip(
-            "Open RORB Catchment (.catg) File Editor\n"
-            "View/edit nodes, reaches, storages,\n"
-            "print flags, and routing data"
-        )
-        self.action_catg.triggered.connect(self.run_catg)
-        self.toolbar.addAction(self.action_catg)
-        self.iface.addPluginToMenu(self.menu_name, self.action_catg)
-        self.actions.append(self.action_catg)
-
-        # ---- STM Editor action ----
-        icon_stm_path = os.path.join(self.plugin_dir, 'icon_stm.svg')
-        icon_stm = QIcon(icon_stm_path)
-
-        self.action_stm = QAction(
-            icon_stm,
-            self.tr("RORB STM Editor"),
-            self.iface.mainWindow()
-        )
-        self.action_stm.setToolTip(
-            "Open RORB Storm (.stm) File Editor\n"
-            "View/edit storm parameters, bursts,\n"
-            "pluviographs, and hydrograph data"
-        )
-        self.action_stm.triggered.connect(self.run_stm)
-        self.toolbar.addAction(self.action_stm)
-        self.iface.addPluginToMenu(self.menu_name, self.action_stm)
-        self.actions.append(self.action_stm)
-
-    def run_catg(self):
-        """Launch a new CATG Editor dialog window."""
-        from .editors.rorb_catg_editor import CATGEditorDialog
-        
-        # Create a fresh, independent dialog instance each time
-        dlg = CATGEditorDialog(parent=None)  # No parent = independent window
-        dlg.setAttribute(Qt.WA_DeleteOnClose, True)  # Auto-cleanup when closed
-        dlg.show()
-        dlg.raise_()
-        dlg.activateWindow()
-        
-        # Track the dialog for any cleanup if needed
-        self.dialogs.append(dlg)
-        # Remove from list when closed
-        dlg.finished.connect(lambda: self.dialogs.remove(dlg) if dlg in self.dialogs else None)
-
-    def run_stm(self):
-        """Launch a new STM Editor dialog window."""
-        from .editors.rorb_stm_editor import STMEditorDialog
-        
-        # Create a fresh, independent dialog instance each time
-        dlg = STMEditorDialog(parent=None)  # No parent = independent window
-        dlg.setAttribute(Qt.WA_DeleteOnClose, True)  # Auto-cleanup when closed
-        dlg.show()
-        dlg.raise_()
-        dlg.activateWindow()
-        
-        # Track the dialog for any cleanup if needed
-        self.dialogs.append(dlg)
-        # Remove from list when closed
-        dlg.finished.connect(lambda: self.dialogs.remove(dlg) if dlg in self.dialogs else None)
-
-    def unload(self):
-        """Unload the plugin - called when plugin is unloaded."""
-        # Remove menu items
-        for action in self.actions:
-            self.iface.removePluginMenu(self.menu_name, action)
-
-        # Remove toolbar
-        if self.toolbar:
-            del self.toolbar
-
-        # Close all open dialogs
-        for dlg in self.dialogs[:]:  # Copy list to avoid modification during iteration
-            dlg.close()
-        self.dialogs = []
+# -*- coding: utf-8 -*-
+"""
+RORB catg/stm Editor - Main Plugin Class
+
+Registers two toolbar actions:
+  1. CATG Editor — open/edit RORB Catchment (.catg) files in table format
+  2. STM Editor  — open/edit/create RORB Storm (.stm) files in table format
+"""
+
+import os
+import weakref
+
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt, QTimer
+from qgis.PyQt.QtWidgets import QAction
+from qgis.PyQt.QtGui import QIcon, QPixmap, QPainter
+from qgis.PyQt.QtSvg import QSvgRenderer
+
+from . import resources_rc  # noqa: F401  # registers the ':/rorb' icons
+
+_ICON_CACHE = {}
+
+# Standard icon sizes Qt may request (toolbar, menu, HiDPI doubles)
+_ICON_SIZES = (16, 22, 24, 32, 48)
+
+
+def _icon(path, size=24):
+    """Parse an SVG icon once and cache a QIcon covering all sizes.
+
+    QIcon(path) leaves the SVG to be re-parsed on first paint at every
+    distinct size Qt requests (toolbar, menu, hover, HiDPI doubles);
+    parsing once and adding a pre-rendered pixmap per size serves them
+    all as plain raster lookups for the lifetime of the session.
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        renderer = QSvgRenderer(path)
+        icon = QIcon()
+        sizes = {s * dpr for s in _ICON_SIZES + (size,) for dpr in (1, 2)}
+        for s in sorted(sizes):
+            pm = QPixmap(s, s)
+            pm.fill(Qt.transparent)
+            painter = QPainter(pm)
+            renderer.render(painter)
+            painter.end()
+            icon.addPixmap(pm, QIcon.Normal, QIcon.Off)
+        _ICON_CACHE[path] = icon
+    return icon
+
+
+class RORBFileEditorPlugin:
+    """Main plugin class for RORB File Editor."""
+
+    menu_name = "RORB catg/stm Editor"
+
+    _CATG_TOOLTIP = (
+        "Open RORB Catchment (.catg) File Editor\n"
+        "View/edit nodes, reaches, storages,\n"
+        "print flags, and routing data"
+    )
+    _STM_TOOLTIP = (
+        "Open RORB Storm (.stm) File Editor\n"
+        "View/edit storm parameters, bursts,\n"
+        "pluviographs, and hydrograph data"
+    )
+
+    def __init__(self, iface):
+        """
+        Initialize the plugin.
+
+        Args:
+            iface: QGIS interface instance
+        """
+        self.iface = iface
+        self.plugin_dir = os.path.dirname(__file__)
+        self.actions = []
+        self.toolbar = None
+        # Open dialogs, tracked weakly: WA_DeleteOnClose owns the
+        # lifecycle, and the WeakSet drops entries on its own.
+        self.dialogs = weakref.WeakSet()
+        # Memoized editor dialog classes, keyed by editor kind
+        self._editor_cls = {'catg': None, 'stm': None}
+
+        self.translator = None  # set only if a translation loads
+        self._tr = QCoreApplication.translate
+
+        # Load the translation on the event loop's first idle tick so
+        # plugin construction never blocks on a .qm read (QGIS profiles
+        # can live on slow/network storage).
+        QTimer.singleShot(0, self._install_translator)
+
+    def _install_translator(self):
+        """Load and install the locale translation, if one exists."""
+        locale_setting = QSettings().value('locale/userLocale')
+        locale = locale_setting[0:2] if locale_setting else 'en'
+
+        # QTranslator.load() returns False on a missing file, so no
+        # separate os.path.exists() stat is needed.
+        translator = QTranslator()
+        if translator.load(
+                'RORBFileEditor_{}.qm'.format(locale),
+                os.path.join(self.plugin_dir, 'i18n')):
+            QCoreApplication.installTranslator(translator)
+            self.translator = translator
+
+    def tr(self, message):
+        """Translate string."""
+        return self._tr('RORBFileEditorPlugin', message)
+
+    def initGui(self):
+        """Initialize the GUI - called when plugin is loaded."""
+        # Create toolbar
+        self.toolbar = self.iface.addToolBar(self.menu_name)
+        self.toolbar.setObjectName("RORBCatgStmEditorToolbar")
+        icon_size = self.iface.iconSize(False).width()
+        main_window = self.iface.mainWindow()
+
+        # ---- CATG Editor action ----
+        self.action_catg = QAction(
+            _icon(":/rorb/icon_catg.svg", icon_size),
+            self.tr("RORB CATG Editor"),
+            main_window
+        )
+        self.action_catg.setToolTip(self._CATG_TOOLTIP)
+        self.action_catg.triggered.connect(self.run_catg)
+        self.toolbar.addAction(self.action_catg)
+        self.iface.addPluginToMenu(self.menu_name, self.action_catg)
+        self.actions.append(self.action_catg)
+
+        # ---- STM Editor action ----
+        self.action_stm = QAction(
+            _icon(":/rorb/icon_stm.svg", icon_size),
+            self.tr("RORB STM Editor"),
+            main_window
+        )
+        self.action_stm.setToolTip(self._STM_TOOLTIP)
+        self.action_stm.triggered.connect(self.run_stm)
+        self.toolbar.addAction(self.action_stm)
+        self.iface.addPluginToMenu(self.menu_name, self.action_stm)
+        self.actions.append(self.action_stm)
+
+        # Resolve the editor modules once QGIS is idle, so the first
+        # toolbar click doesn't pay the import cost while the user waits.
+        QTimer.singleShot(0, self._preload_editors)
+
+    def _editor_class(self, kind):
+        """Import (once) and return the dialog class for an editor kind."""
+        cls = self._editor_cls[kind]
+        if cls is None:
+            if kind == 'catg':
+                from .editors.rorb_catg_editor import CATGEditorDialog
+                cls = CATGEditorDialog
+            else:
+                from .editors.rorb_stm_editor import STMEditorDialog
+                cls = STMEditorDialog
+            self._editor_cls[kind] = cls
+        return cls
+
+    def _preload_editors(self):
+        """Import and memoize the editor dialog classes."""
+        for kind in self._editor_cls:
+            self._editor_class(kind)
+
+    def _run(self, kind):
+        """Launch a fresh, independent editor dialog of the given kind."""
+        dlg = self._editor_class(kind)(parent=None)  # No parent = independent window
+        dlg.setAttribute(Qt.WA_DeleteOnClose, True)  # Auto-cleanup when closed
+        dlg.show()
+        # One window-state change instead of raise_() + activateWindow()
+        # (each a separate window-manager round-trip)
+        dlg.setWindowState(
+            dlg.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
+
+        self.dialogs.add(dlg)
+
+    def run_catg(self):
+        """Launch a new CATG Editor dialog window."""
+        self._run('catg')
+
+    def run_stm(self):
+        """Launch a new STM Editor dialog window."""
+        self._run('stm')
+
+    def unload(self):
+        """Unload the plugin - called when plugin is unloaded."""
+        # Remove menu items and schedule the QActions for deletion
+        for action in self.actions:
+            self.iface.removePluginMenu(self.menu_name, action)
+            action.deleteLater()
+        self.actions.clear()
+
+        # Remove toolbar: deleteLater() actually destroys the widget;
+        # del only dropped the Python reference and left a zombie
+        # toolbar behind on every plugin reload.
+        if self.toolbar:
+            self.toolbar.deleteLater()
+            self.toolbar = None
+
+        # Uninstall the translator, or each plugin reload would leave
+        # another one on Qt's global list (consulted on every tr()).
+        if self.translator is not None:
+            QCoreApplication.removeTranslator(self.translator)
+            self.translator = None
+
+        # Close all open dialogs (snapshot: closing mutates the set).
+        # The WeakSet can briefly hold wrappers whose C++ side is
+        # already deleted, so guard before touching them.
+        for dlg in list(self.dialogs):
+            if not sip.isdeleted(dlg):
+                dlg.close()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled Qt resources for the RORB catg/stm Editor plugin.
+
+Generated from resources.qrc (pyrcc5-compatible, rcc format v1).
+Regenerate with:  pyrcc5 resources.qrc -o resources_rc.py
+"""
+
+from qgis.PyQt import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x06\x5a\x3c\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\
+\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\
+\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\
+\x36\x34\x20\x36\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x36\x34\x22\x3e\x3c\x64\x65\x66\x73\x3e\x3c\x6c\
+\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\x6e\x74\x20\x69\x64\x3d\x22\x62\
+\x67\x5f\x73\x74\x6d\x22\x20\x78\x31\x3d\x22\x30\x22\x20\x79\x31\x3d\x22\x30\
+\x22\x20\x78\x32\x3d\x22\x30\x22\x20\x79\x32\x3d\x22\x31\x22\x3e\x3c\x73\x74\
+\x6f\x70\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x25\x22\x20\x73\x74\x6f\x70\
+\x2d\x63\x6f\x6c\x6f\x72\x3d\x22\x23\x31\x35\x36\x35\x43\x30\x22\x2f\x3e\x3c\
+\x73\x74\x6f\x70\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x30\x30\x25\x22\x20\
+\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3d\x22\x23\x30\x44\x34\x37\x41\x31\
+\x22\x2f\x3e\x3c\x2f\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\x6e\x74\
+\x3e\x3c\x2f\x64\x65\x66\x73\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x22\
+\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x20\x72\x78\x3d\x22\x31\x34\x22\x20\
+\x72\x79\x3d\x22\x31\x34\x22\x20\x66\x69\x6c\x6c\x3d\x22\x75\x72\x6c\x28\x23\
+\x62\x67\x5f\x73\x74\x6d\x29\x22\x2f\x3e\x3c\x65\x6c\x6c\x69\x70\x73\x65\x20\
+\x63\x78\x3d\x22\x32\x36\x22\x20\x63\x79\x3d\x22\x31\x37\x22\x20\x72\x78\x3d\
+\x22\x31\x30\x22\x20\x72\x79\x3d\x22\x36\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
+\x39\x30\x43\x41\x46\x39\x22\x20\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\
+\x38\x22\x2f\x3e\x3c\x65\x6c\x6c\x69\x70\x73\x65\x20\x63\x78\x3d\x22\x33\x38\
+\x22\x20\x63\x79\x3d\x22\x31\x37\x22\x20\x72\x78\x3d\x22\x38\x22\x20\x72\x79\
+\x3d\x22\x35\x2e\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x39\x30\x43\x41\x46\
+\x39\x22\x20\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\
+\x65\x6c\x6c\x69\x70\x73\x65\x20\x63\x78\x3d\x22\x33\x32\x22\x20\x63\x79\x3d\
+\x22\x31\x34\x22\x20\x72\x78\x3d\x22\x37\x22\x20\x72\x79\x3d\x22\x35\x22\x20\
+\x66\x69\x6c\x6c\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3d\x22\x30\x2e\x37\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x32\x32\x22\x20\x79\x31\x3d\x22\x32\x34\x22\x20\x78\x32\x3d\x22\x32\
+\x30\x22\x20\x79\x32\x3d\x22\x33\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\
+\x23\x34\x46\x43\x33\x46\x37\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\
+\x65\x63\x61\x70\x3d\x22\x72\x6f\x75\x6e\x64\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x32\x38\x22\x20\x79\x31\x3d\x22\x32\x34\x22\x20\x78\x32\
+\x3d\x22\x32\x36\x22\x20\x79\x32\x3d\x22\x33\x31\x22\x20\x73\x74\x72\x6f\x6b\
+\x65\x3d\x22\x23\x34\x46\x43\x33\x46\x37\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\
+\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\
+\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\x72\x6f\x75\x6e\x64\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x33\x34\x22\x20\x79\x31\x3d\x22\x32\x34\x22\
+\x20\x78\x32\x3d\x22\x33\x32\x22\x20\x79\x32\x3d\x22\x33\x30\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x46\x43\x33\x46\x37\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\x72\x6f\x75\x6e\x64\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x34\x30\x22\x20\x79\x31\x3d\x22\
+\x32\x34\x22\x20\x78\x32\x3d\x22\x33\x38\x22\x20\x79\x32\x3d\x22\x32\x39\x22\
+\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x34\x46\x43\x33\x46\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\x72\x6f\x75\x6e\
+\x64\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\
+\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x31\x38\x22\x20\x72\x78\x3d\x22\x32\x2e\x35\x22\x20\x66\
+\x69\x6c\x6c\x3d\x22\x23\x66\x66\x66\x22\x20\x6f\x70\x61\x63\x69\x74\x79\x3d\
+\x22\x30\x2e\x39\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x34\x22\
+\x20\x79\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x72\x78\x3d\x22\x32\x2e\x35\x22\
+\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x34\x42\x35\x46\x36\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\x31\x3d\x22\x34\x34\x22\
+\x20\x78\x32\x3d\x22\x35\x30\x22\x20\x79\x32\x3d\x22\x34\x34\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x6c\x69\
+\x6e\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\x31\x3d\x22\x34\x38\x22\x20\
+\x78\x32\x3d\x22\x35\x30\x22\x20\x79\x32\x3d\x22\x34\x38\x22\x20\x73\x74\x72\
+\x6f\x6b\x65\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x73\x74\x72\x6f\x6b\
+\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\
+\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\x31\x3d\x22\x35\x32\x22\x20\x78\
+\x32\x3d\x22\x35\x30\x22\x20\x79\x32\x3d\x22\x35\x32\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x73\x74\x72\x6f\x6b\x65\
+\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x32\x36\x22\x20\x79\x31\x3d\x22\x34\x31\x22\x20\x78\x32\
+\x3d\x22\x32\x36\x22\x20\x79\x32\x3d\x22\x35\x34\x22\x20\x73\x74\x72\x6f\x6b\
+\x65\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\
+\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x33\x38\x22\x20\x79\x31\x3d\x22\x34\x31\x22\x20\x78\x32\x3d\
+\x22\x33\x38\x22\x20\x79\x32\x3d\x22\x35\x34\x22\x20\x73\x74\x72\x6f\x6b\x65\
+\x3d\x22\x23\x42\x42\x44\x45\x46\x42\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\
+\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x74\x65\x78\x74\x20\x78\
+\x3d\x22\x33\x32\x22\x20\x79\x3d\x22\x33\x39\x2e\x35\x22\x20\x66\x6f\x6e\x74\
+\x2d\x66\x61\x6d\x69\x6c\x79\x3d\x22\x41\x72\x69\x61\x6c\x2c\x48\x65\x6c\x76\
+\x65\x74\x69\x63\x61\x2c\x73\x61\x6e\x73\x2d\x73\x65\x72\x69\x66\x22\x20\x66\
+\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3d\x22\x34\x22\x20\x66\x6f\x6e\x74\x2d\x77\
+\x65\x69\x67\x68\x74\x3d\x22\x62\x6f\x6c\x64\x22\x20\x66\x69\x6c\x6c\x3d\x22\
+\x23\x66\x66\x66\x22\x20\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3d\x22\
+\x6d\x69\x64\x64\x6c\x65\x22\x20\x64\x6f\x6d\x69\x6e\x61\x6e\x74\x2d\x62\x61\
+\x73\x65\x6c\x69\x6e\x65\x3d\x22\x63\x65\x6e\x74\x72\x61\x6c\x22\x3e\x53\x54\
+\x4d\x3c\x2f\x74\x65\x78\x74\x3e\x3c\x2f\x73\x76\x67\x3e\x0a\x00\x00\x05\x5f\
+\x3c\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x36\x34\x20\x36\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x36\x34\x22\x3e\x3c\x64\x65\x66\x73\x3e\x3c\x6c\x69\x6e\x65\x61\
+\x72\x47\x72\x61\x64\x69\x65\x6e\x74\x20\x69\x64\x3d\x22\x62\x67\x5f\x63\x61\
+\x74\x67\x22\x20\x78\x31\x3d\x22\x30\x22\x20\x79\x31\x3d\x22\x30\x22\x20\x78\
+\x32\x3d\x22\x30\x22\x20\x79\x32\x3d\x22\x31\x22\x3e\x3c\x73\x74\x6f\x70\x20\
+\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x25\x22\x20\x73\x74\x6f\x70\x2d\x63\x6f\
+\x6c\x6f\x72\x3d\x22\x23\x32\x45\x37\x44\x33\x32\x22\x2f\x3e\x3c\x73\x74\x6f\
+\x70\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x30\x30\x25\x22\x20\x73\x74\x6f\
+\x70\x2d\x63\x6f\x6c\x6f\x72\x3d\x22\x23\x31\x42\x35\x45\x32\x30\x22\x2f\x3e\
+\x3c\x2f\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\x3c\x2f\
+\x64\x65\x66\x73\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\
+\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x36\x30\x22\x20\x72\x78\x3d\x22\x31\x34\x22\x20\x72\x79\x3d\
+\x22\x31\x34\x22\x20\x66\x69\x6c\x6c\x3d\x22\x75\x72\x6c\x28\x23\x62\x67\x5f\
+\x63\x61\x74\x67\x29\x22\x2f\x3e\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x31\x38\x22\x20\x63\x79\x3d\x22\x31\x36\x22\x20\x72\x3d\x22\x34\x22\x20\
+\x66\x69\x6c\x6c\x3d\x22\x23\x41\x35\x44\x36\x41\x37\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x3d\x22\x23\x66\x66\x66\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
+\x64\x74\x68\x3d\x22\x31\x2e\x32\x22\x2f\x3e\x3c\x63\x69\x72\x63\x6c\x65\x20\
+\x63\x78\x3d\x22\x34\x36\x22\x20\x63\x79\x3d\x22\x31\x36\x22\x20\x72\x3d\x22\
+\x34\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x41\x35\x44\x36\x41\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x3d\x22\x23\x66\x66\x66\x22\x20\x73\x74\x72\x6f\x6b\x65\
+\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x32\x22\x2f\x3e\x3c\x63\x69\x72\x63\
+\x6c\x65\x20\x63\x78\x3d\x22\x33\x32\x22\x20\x63\x79\x3d\x22\x33\x32\x22\x20\
+\x72\x3d\x22\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x36\x42\x42\x36\x41\
+\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x66\x66\x66\x22\x20\x73\x74\x72\
+\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x38\x22\x20\x79\x31\x3d\x22\x31\x36\x22\
+\x20\x78\x32\x3d\x22\x33\x32\x22\x20\x79\x32\x3d\x22\x33\x32\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x43\x38\x45\x36\x43\x39\x22\x20\x73\x74\x72\x6f\
+\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x34\x36\x22\x20\x79\x31\x3d\x22\x31\x36\x22\x20\x78\x32\x3d\x22\x33\
+\x32\x22\x20\x79\x32\x3d\x22\x33\x32\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\
+\x23\x43\x38\x45\x36\x43\x39\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x2e\x35\x22\x20\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\
+\x2e\x38\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x34\x22\x20\x79\
+\x3d\x22\x34\x30\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x72\x78\x3d\x22\x32\x2e\x35\x22\x20\
+\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\x66\x22\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3d\x22\x30\x2e\x39\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x34\
+\x22\x20\x79\x3d\x22\x34\x30\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x35\x22\x20\x72\x78\x3d\x22\x32\
+\x2e\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x38\x31\x43\x37\x38\x34\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\x31\x3d\x22\
+\x34\x38\x22\x20\x78\x32\x3d\x22\x35\x30\x22\x20\x79\x32\x3d\x22\x34\x38\x22\
+\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x43\x38\x45\x36\x43\x39\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\
+\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\x31\x3d\x22\x35\
+\x32\x22\x20\x78\x32\x3d\x22\x35\x30\x22\x20\x79\x32\x3d\x22\x35\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x43\x38\x45\x36\x43\x39\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x36\x22\x20\x79\x31\x3d\x22\x34\x34\
+\x2e\x35\x22\x20\x78\x32\x3d\x22\x32\x36\x22\x20\x79\x32\x3d\x22\x35\x36\x22\
+\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x43\x38\x45\x36\x43\x39\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\x3e\
+\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x33\x38\x22\x20\x79\x31\x3d\x22\x34\
+\x34\x2e\x35\x22\x20\x78\x32\x3d\x22\x33\x38\x22\x20\x79\x32\x3d\x22\x35\x36\
+\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x43\x38\x45\x36\x43\x39\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x38\x22\x2f\
+\x3e\x3c\x74\x65\x78\x74\x20\x78\x3d\x22\x33\x32\x22\x20\x79\x3d\x22\x34\x33\
+\x2e\x35\x22\x20\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3d\x22\x41\x72\
+\x69\x61\x6c\x2c\x48\x65\x6c\x76\x65\x74\x69\x63\x61\x2c\x73\x61\x6e\x73\x2d\
+\x73\x65\x72\x69\x66\x22\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3d\x22\x33\
+\x2e\x38\x22\x20\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3d\x22\x62\x6f\
+\x6c\x64\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\x66\x22\x20\x74\x65\x78\
+\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3d\x22\x6d\x69\x64\x64\x6c\x65\x22\x20\x64\
+\x6f\x6d\x69\x6e\x61\x6e\x74\x2d\x62\x61\x73\x65\x6c\x69\x6e\x65\x3d\x22\x63\
+\x65\x6e\x74\x72\x61\x6c\x22\x3e\x43\x41\x54\x47\x3c\x2f\x74\x65\x78\x74\x3e\
+\x3c\x2f\x73\x76\x67\x3e\x0a"
+
+qt_resource_name = b"\
+\x00\x04\x00\x07\x96\x82\x00\x72\x00\x6f\x00\x72\x00\x62\x00\x0c\x07\x5c\x92\
+\x07\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x73\x00\x74\x00\x6d\x00\x2e\
+\x00\x73\x00\x76\x00\x67\x00\x0d\x07\xe6\xd0\x47\x00\x69\x00\x63\x00\x6f\x00\
+\x6e\x00\x5f\x00\x63\x00\x61\x00\x74\x00\x67\x00\x2e\x00\x73\x00\x76\x00\x67"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\
+\x02\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x5e"
+
+
+def qInitResources():
+    QtCore.qRegisterResourceData(
+        0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(
+        0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+
+qInitResources()